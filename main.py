@@ -1,8 +1,15 @@
+import math
 import sys
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
+import numpy as np
 import pygame
+from pygame._sdl2.video import Renderer, Texture, Window
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
 
 
 SCREEN_WIDTH = 960
@@ -10,40 +17,110 @@ SCREEN_HEIGHT = 640
 BACKGROUND_COLOR = (26, 29, 33)
 PLAYER_COLOR = (90, 200, 250)
 PLAYER_SPEED = 200  # pixels per second
+PLAYER_MIN = 16
+PLAYER_MAX_X = SCREEN_WIDTH - 16
+PLAYER_MAX_Y = SCREEN_HEIGHT - 16
 HACK_RADIUS = 200
+HACK_RADIUS_SQ = HACK_RADIUS * HACK_RADIUS
 HIGHLIGHT_COLOR = (255, 215, 0)
 TEXT_COLOR = (240, 240, 240)
 ACTION_TEXT_COLOR = (140, 200, 255)
 STATUS_TEXT_COLOR = (255, 180, 70)
 
-
-Vector2 = pygame.math.Vector2
+MOVEMENT_KEYS: Dict[int, Tuple[int, int]] = {
+    pygame.K_w: (0, -1),
+    pygame.K_UP: (0, -1),
+    pygame.K_s: (0, 1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_a: (-1, 0),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_d: (1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
 
 
-def clamp(value: float, minimum: float, maximum: float) -> float:
-    return max(min(value, maximum), minimum)
+Vector2 = pygame.math.Vector2
 
 
-@dataclass
-class Action:
+def _nearest_index_numpy(positions: np.ndarray, px: float, py: float, radius_sq: float) -> int:
+    if positions.shape[0] == 0:
+        return -1
+    offsets = positions - (px, py)
+    distances = np.einsum("ij,ij->i", offsets, offsets)
+    index = int(distances.argmin())
+    return index if distances[index] <= radius_sq else -1
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def nearest_index(positions: np.ndarray, px: float, py: float, radius_sq: float) -> int:
+        # No np.inf sentinel: fastmath lets LLVM assume every value is finite
+        best_index = -1
+        best = 0.0
+        for index in range(positions.shape[0]):
+            dx = positions[index, 0] - px
+            dy = positions[index, 1] - py
+            distance = dx * dx + dy * dy
+            if best_index < 0 or distance < best:
+                best = distance
+                best_index = index
+        if best_index < 0 or best > radius_sq:
+            return -1
+        return best_index
+
+else:
+    nearest_index = _nearest_index_numpy
+
+
+class SpriteCache:
+    __slots__ = ("renderer", "_textures")
+
+    def __init__(self, renderer: Renderer):
+        self.renderer = renderer
+        self._textures: Dict[tuple, Texture] = {}
+
+    def circle(self, color: Tuple[int, int, int], radius: int, width: int = 0) -> Texture:
+        key = ("circle", color, radius, width)
+        texture = self._textures.get(key)
+        if texture is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius, width)
+            texture = Texture.from_surface(self.renderer, sprite)
+            self._textures[key] = texture
+        return texture
+
+    def rect(self, size: Tuple[int, int], color: Tuple[int, int, int], highlighted: bool) -> Texture:
+        key = ("rect", size, color, highlighted)
+        texture = self._textures.get(key)
+        if texture is None:
+            sprite = pygame.Surface(size)
+            sprite.fill(color)
+            if highlighted:
+                pygame.draw.rect(sprite, HIGHLIGHT_COLOR, sprite.get_rect(), 3)
+            texture = Texture.from_surface(self.renderer, sprite)
+            self._textures[key] = texture
+        return texture
+
+
+class Action(NamedTuple):
     key: int
     label: str
-    handler: Callable[["Hackable"], Optional[str]]
+    handler: Callable[[Any], Optional[str]]
 
 
 class Hackable:
+    __slots__ = ("position",)
+
     name: str = "Hackable"
 
     def __init__(self, position: Tuple[float, float]):
         self.position = Vector2(position)
 
-    def distance_to(self, point: Vector2) -> float:
-        return self.position.distance_to(point)
+    def get_actions(self) -> Tuple[Action, ...]:
+        return ()
 
-    def get_actions(self) -> List[Action]:
-        return []
-
-    def draw(self, surface: pygame.Surface, highlighted: bool = False) -> None:
+    def draw(self, sprites: SpriteCache, highlighted: bool = False) -> None:
         raise NotImplementedError
 
     def update(self, dt: float) -> None:
@@ -51,6 +128,8 @@ class Hackable:
 
 
 class Door(Hackable):
+    __slots__ = ("rect", "locked", "opened", "_actions", "_open_rect")
+
     name = "Door"
 
     def __init__(self, rect: pygame.Rect, locked: bool = False, opened: bool = False):
@@ -58,57 +137,65 @@ class Door(Hackable):
         self.rect = rect
         self.locked = locked
         self.opened = opened
+        self._actions: Optional[Tuple[Action, ...]] = None
+        self._open_rect = self._create_open_rect()
+
+    def _create_open_rect(self) -> pygame.Rect:
+        # Slide the door open visually by shrinking it toward one side
+        door_rect = self.rect.copy()
+        if door_rect.width > door_rect.height:
+            door_rect.width = max(6, door_rect.width // 4)
+            door_rect.x = self.rect.x if (self.rect.y // 32) % 2 == 0 else self.rect.right - door_rect.width
+        else:
+            door_rect.height = max(6, door_rect.height // 4)
+            door_rect.y = self.rect.y if (self.rect.x // 32) % 2 == 0 else self.rect.bottom - door_rect.height
+        return door_rect
 
     def toggle_open(self) -> Optional[str]:
         if self.locked:
             return "Door is locked. Unlock it first."
         self.opened = not self.opened
+        self._actions = None
         state = "opened" if self.opened else "closed"
         return f"Door {state}."
 
     def toggle_lock(self) -> Optional[str]:
         self.locked = not self.locked
+        self._actions = None
         state = "locked" if self.locked else "unlocked"
         return f"Door {state}."
 
-    def get_actions(self) -> List[Action]:
-        label = "Close door" if self.opened else "Open door"
-        lock_label = "Unlock door" if self.locked else "Lock door"
-        return [
-            Action(pygame.K_1, label, lambda obj: obj.toggle_open()),
-            Action(pygame.K_2, lock_label, lambda obj: obj.toggle_lock()),
-        ]
-
-    def draw(self, surface: pygame.Surface, highlighted: bool = False) -> None:
+    def get_actions(self) -> Tuple[Action, ...]:
+        if self._actions is None:
+            label = "Close door" if self.opened else "Open door"
+            lock_label = "Unlock door" if self.locked else "Lock door"
+            self._actions = (
+                Action(pygame.K_1, label, Door.toggle_open),
+                Action(pygame.K_2, lock_label, Door.toggle_lock),
+            )
+        return self._actions
+
+    def draw(self, sprites: SpriteCache, highlighted: bool = False) -> None:
         color = (120, 120, 130)
         if self.locked:
             color = (200, 70, 70)
         elif self.opened:
             color = (120, 200, 120)
 
-        door_rect = self.rect.copy()
-        if self.opened:
-            # Slide the door open visually by shrinking it toward one side
-            if door_rect.width > door_rect.height:
-                door_rect.width = max(6, door_rect.width // 4)
-                door_rect.x = self.rect.x if (self.rect.y // 32) % 2 == 0 else self.rect.right - door_rect.width
-            else:
-                door_rect.height = max(6, door_rect.height // 4)
-                door_rect.y = self.rect.y if (self.rect.x // 32) % 2 == 0 else self.rect.bottom - door_rect.height
-
-        pygame.draw.rect(surface, color, door_rect)
-
-        if highlighted:
-            pygame.draw.rect(surface, HIGHLIGHT_COLOR, door_rect, 3)
+        door_rect = self._open_rect if self.opened else self.rect
+        sprites.rect(door_rect.size, color, highlighted).draw(dstrect=door_rect)
 
 
 class NPC(Hackable):
+    __slots__ = ("distracted", "distract_timer", "_center")
+
     name = "NPC"
 
     def __init__(self, position: Tuple[float, float]):
         super().__init__(position)
         self.distracted = False
         self.distract_timer = 0.0
+        self._center = (int(self.position.x), int(self.position.y))
 
     def distract(self) -> Optional[str]:
         if self.distracted:
@@ -117,57 +204,83 @@ class NPC(Hackable):
         self.distract_timer = 3.5
         return "NPC distracted with phone."
 
-    def get_actions(self) -> List[Action]:
-        return [
-            Action(pygame.K_1, "Distract with phone", lambda obj: obj.distract()),
-        ]
+    def get_actions(self) -> Tuple[Action, ...]:
+        return NPC_ACTIONS
 
     def update(self, dt: float) -> None:
         if self.distracted:
-            self.distract_timer = max(0.0, self.distract_timer - dt)
-            if self.distract_timer <= 0:
+            timer = self.distract_timer - dt
+            if timer <= 0:
+                timer = 0.0
                 self.distracted = False
+            self.distract_timer = timer
 
-    def draw(self, surface: pygame.Surface, highlighted: bool = False) -> None:
+    def draw(self, sprites: SpriteCache, highlighted: bool = False) -> None:
         base_color = (80, 180, 90)
         if self.distracted:
             base_color = (240, 210, 60)
-        pygame.draw.circle(surface, base_color, self.position, 18)
+        x, y = self._center
+        sprites.circle(base_color, 18).draw(dstrect=(x - 18, y - 18))
         if highlighted:
-            pygame.draw.circle(surface, HIGHLIGHT_COLOR, self.position, 22, 3)
+            sprites.circle(HIGHLIGHT_COLOR, 22, 3).draw(dstrect=(x - 22, y - 22))
+
+
+NPC_ACTIONS = (Action(pygame.K_1, "Distract with phone", NPC.distract),)
 
 
 class Player:
+    __slots__ = ("x", "y", "_held_keys", "_vx", "_vy")
+
     def __init__(self, position: Tuple[float, float]):
-        self.position = Vector2(position)
+        self.x, self.y = float(position[0]), float(position[1])
+        self._held_keys: Set[int] = set()
+        self._vx = 0.0
+        self._vy = 0.0
+
+    def handle_key(self, key: int, pressed: bool) -> None:
+        if key not in MOVEMENT_KEYS:
+            return
+        if pressed:
+            self._held_keys.add(key)
+        else:
+            self._held_keys.discard(key)
+
+        # W and Up count once; opposite directions cancel
+        directions = {MOVEMENT_KEYS[held] for held in self._held_keys}
+        mx = float(sum(dx for dx, _ in directions))
+        my = float(sum(dy for _, dy in directions))
+        if mx or my:
+            scale = PLAYER_SPEED / math.sqrt(mx * mx + my * my)
+            mx *= scale
+            my *= scale
+        self._vx, self._vy = mx, my
 
     def handle_input(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
-        movement = Vector2(0, 0)
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            movement.y -= 1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            movement.y += 1
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            movement.x -= 1
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            movement.x += 1
-
-        if movement.length_squared() > 0:
-            movement = movement.normalize()
-        self.position += movement * PLAYER_SPEED * dt
-        self.position.x = clamp(self.position.x, 16, SCREEN_WIDTH - 16)
-        self.position.y = clamp(self.position.y, 16, SCREEN_HEIGHT - 16)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.circle(surface, PLAYER_COLOR, self.position, 16)
+        x = self.x + self._vx * dt
+        y = self.y + self._vy * dt
+        self.x = PLAYER_MIN if x < PLAYER_MIN else (PLAYER_MAX_X if x > PLAYER_MAX_X else x)
+        self.y = PLAYER_MIN if y < PLAYER_MIN else (PLAYER_MAX_Y if y > PLAYER_MAX_Y else y)
+
+    def draw(self, sprites: SpriteCache) -> None:
+        sprites.circle(PLAYER_COLOR, 16).draw(dstrect=(int(self.x) - 16, int(self.y) - 16))
 
 
 class HUD:
+    __slots__ = ("font", "status_message", "status_timer", "_text_cache")
+
     def __init__(self, font: pygame.font.Font):
         self.font = font
         self.status_message = ""
         self.status_timer = 0.0
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], Texture] = {}
+
+    def _text(self, renderer: Renderer, text: str, color: Tuple[int, int, int]) -> Texture:
+        key = (text, color)
+        rendered = self._text_cache.get(key)
+        if rendered is None:
+            rendered = Texture.from_surface(renderer, self.font.render(text, True, color))
+            self._text_cache[key] = rendered
+        return rendered
 
     def show_status(self, message: str) -> None:
         if message:
@@ -175,41 +288,50 @@ class HUD:
             self.status_timer = 2.5
 
     def update(self, dt: float) -> None:
-        if self.status_timer > 0:
-            self.status_timer = max(0.0, self.status_timer - dt)
-            if self.status_timer == 0:
+        timer = self.status_timer
+        if timer > 0:
+            timer -= dt
+            if timer <= 0:
+                timer = 0.0
                 self.status_message = ""
+            self.status_timer = timer
 
-    def draw(self, surface: pygame.Surface, hackable: Optional[Hackable], actions: List[Action]) -> None:
-        header = self.font.render("2D Watchdogs Prototype", True, TEXT_COLOR)
-        surface.blit(header, (20, 16))
+    def draw(self, renderer: Renderer, hackable: Optional[Hackable], actions: Tuple[Action, ...]) -> None:
+        self._text(renderer, "2D Watchdogs Prototype", TEXT_COLOR).draw(dstrect=(20, 16))
 
         if hackable:
             info_text = f"Nearest: {hackable.name}"
-            distance_text = self.font.render(info_text, True, TEXT_COLOR)
-            surface.blit(distance_text, (20, 56))
+            self._text(renderer, info_text, TEXT_COLOR).draw(dstrect=(20, 56))
             for index, action in enumerate(actions):
                 prefix = pygame.key.name(action.key).upper()
                 label = f"[{prefix}] {action.label}"
-                action_surface = self.font.render(label, True, ACTION_TEXT_COLOR)
-                surface.blit(action_surface, (20, 90 + index * 28))
+                self._text(renderer, label, ACTION_TEXT_COLOR).draw(dstrect=(20, 90 + index * 28))
         else:
-            prompt = self.font.render("Move closer to a hackable object.", True, TEXT_COLOR)
-            surface.blit(prompt, (20, 56))
+            prompt = self._text(renderer, "Move closer to a hackable object.", TEXT_COLOR)
+            prompt.draw(dstrect=(20, 56))
 
         if self.status_message:
-            status_surface = self.font.render(self.status_message, True, STATUS_TEXT_COLOR)
-            surface.blit(status_surface, (20, SCREEN_HEIGHT - 48))
+            status = self._text(renderer, self.status_message, STATUS_TEXT_COLOR)
+            status.draw(dstrect=(20, SCREEN_HEIGHT - 48))
 
 
 class Game:
     def __init__(self) -> None:
         pygame.init()
-        pygame.display.set_caption("2D Watchdogs Prototype")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
+        self.window = Window("2D Watchdogs Prototype", size=(SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = Renderer(self.window)
+        self.renderer.draw_color = pygame.Color(BACKGROUND_COLOR)
+        self.sprites = SpriteCache(self.renderer)
         self.clock = pygame.time.Clock()
         self.player = Player((SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2))
         self.hackables: List[Hackable] = self._create_world()
+        self._positions = np.array(
+            [(hackable.position.x, hackable.position.y) for hackable in self.hackables],
+            dtype=np.float32,
+        ).reshape(-1, 2)
+        self._updatables = [hackable for hackable in self.hackables if type(hackable).update is not Hackable.update]
         self.font = pygame.font.Font(None, 28)
         self.hud = HUD(self.font)
 
@@ -235,22 +357,19 @@ class Game:
 
         return hackables
 
-    def _get_nearest_hackable(self) -> Tuple[Optional[Hackable], List[Action]]:
-        nearest: Optional[Hackable] = None
-        min_distance = float("inf")
-        for hackable in self.hackables:
-            distance = hackable.distance_to(self.player.position)
-            if distance < min_distance and distance <= HACK_RADIUS:
-                min_distance = distance
-                nearest = hackable
-
-        if nearest:
+    def _get_nearest_hackable(self) -> Tuple[Optional[Hackable], Tuple[Action, ...]]:
+        index = nearest_index(self._positions, self.player.x, self.player.y, HACK_RADIUS_SQ)
+        if index >= 0:
+            nearest = self.hackables[index]
             return nearest, nearest.get_actions()
-        return None, []
+        return None, ()
 
     def run(self) -> None:
+        nearest, actions = self._get_nearest_hackable()
         while True:
             dt = self.clock.tick(60) / 1000.0
+            # Action keys apply to the target the HUD showed on the previous frame
+            action_map = {action.key: action for action in actions}
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
@@ -259,35 +378,37 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         pygame.quit()
                         sys.exit()
+                    action = action_map.get(event.key)
+                    if action:
+                        message = action.handler(nearest)
+                        if message:
+                            self.hud.show_status(message)
+                    else:
+                        self.player.handle_key(event.key, True)
+                elif event.type == pygame.KEYUP:
+                    self.player.handle_key(event.key, False)
 
             self.player.handle_input(dt)
 
             nearest, actions = self._get_nearest_hackable()
 
-            for hackable in self.hackables:
+            for hackable in self._updatables:
                 hackable.update(dt)
 
-            pressed = pygame.key.get_pressed()
-            if nearest:
-                for action in actions:
-                    if pressed[action.key]:
-                        message = action.handler(nearest)
-                        if message:
-                            self.hud.show_status(message)
-
             self.hud.update(dt)
             self._draw(nearest, actions)
 
-    def _draw(self, highlighted: Optional[Hackable], actions: List[Action]) -> None:
-        self.screen.fill(BACKGROUND_COLOR)
+    def _draw(self, highlighted: Optional[Hackable], actions: Tuple[Action, ...]) -> None:
+        renderer = self.renderer
+        renderer.clear()
 
         for hackable in self.hackables:
-            hackable.draw(self.screen, highlighted is hackable)
+            hackable.draw(self.sprites, highlighted is hackable)
 
-        self.player.draw(self.screen)
-        self.hud.draw(self.screen, highlighted, actions)
+        self.player.draw(self.sprites)
+        self.hud.draw(renderer, highlighted, actions)
 
-        pygame.display.flip()
+        renderer.present()
 
 
 def main() -> None: